@@ -5,18 +5,22 @@ data/suumo_listings.csv に保存する。
 
 実行方法:
     c:\\Users\\akiya\\Documents\\Quarto\\Qvenv\\Scripts\\python.exe scraping_suumo.py
+    （python data_collect.py suumo からも実行できる）
 
 注意:
     - リクエスト間に 2 秒の待機を入れてサーバー負荷を軽減しています。
     - 生成されたCSVは index.qmd から参照します。
 """
 
+import math
 import re
+import statistics
 import time
+from array import array
+from collections.abc import Callable
 from datetime import date
 from pathlib import Path
 
-import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
@@ -25,7 +29,6 @@ from bs4 import BeautifulSoup
 # ────────────────────────────────────────────────
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR / "data"
-DATA_DIR.mkdir(exist_ok=True)
 OUTPUT_FILE = DATA_DIR / "suumo_listings.csv"
 
 # 対象3市の市区町村コード（SUUMO sc パラメータ）
@@ -55,6 +58,23 @@ HEADERS = {
 DELAY_SECONDS = 2
 REQUEST_TIMEOUT = 20
 MAX_PAGES = 20
+FLUSH_ROWS = 2000  # バッファがこの件数に達したら CSV に書き出す（1ページ取得ごとに確認）
+
+# 出力CSVの列順
+LISTING_COLUMNS = [
+    "市", "種別", "価格（万円）", "間取り",
+    "専有面積（㎡）", "土地面積（㎡）", "建物面積（㎡）",
+    "築年月", "交通", "所在地", "物件名", "URL",
+]
+# 数値列（array("d") で保持し、欠損は NaN）
+FLOAT_COLUMNS = ["価格（万円）", "専有面積（㎡）", "土地面積（㎡）", "建物面積（㎡）"]
+# 値の種類が少ない列（カテゴリコードで保持）
+CATEGORY_COLUMNS = ["市", "種別", "間取り"]
+# その他の文字列列
+STRING_COLUMNS = [
+    col for col in LISTING_COLUMNS
+    if col not in FLOAT_COLUMNS and col not in CATEGORY_COLUMNS
+]
 
 
 # ────────────────────────────────────────────────
@@ -97,13 +117,84 @@ def has_next_page(soup: BeautifulSoup) -> bool:
     return False
 
 
+# ────────────────────────────────────────────────
+# レコード蓄積
+# ────────────────────────────────────────────────
+
+class ListingBuffer:
+    """
+    物件レコードを列ごとに蓄積するバッファ。
+
+    物件ごとに辞書を保持する代わりに、数値列は array("d")（欠損は NaN）、
+    市・種別・間取りはカテゴリコード（array("i")）、その他は列ごとの
+    文字列リストで持つ。カテゴリ値は列ごとに 1 つだけ保持される。
+    """
+
+    __slots__ = ("_floats", "_codes", "_strings", "_categories", "_lookup")
+
+    def __init__(self) -> None:
+        self._categories: dict[str, list[str]] = {col: [] for col in CATEGORY_COLUMNS}
+        self._lookup: dict[str, dict[str, int]] = {col: {} for col in CATEGORY_COLUMNS}
+        self._reset_columns()
+
+    def _reset_columns(self) -> None:
+        # to_frame() の DataFrame が配列のバッファを参照している可能性があるため、
+        # 既存の配列は縮めずに新しい配列へ差し替える
+        self._floats = {col: array("d") for col in FLOAT_COLUMNS}
+        self._codes = {col: array("i") for col in CATEGORY_COLUMNS}
+        self._strings: dict[str, list[str]] = {col: [] for col in STRING_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self._codes["市"])
+
+    def append(self, record: dict) -> None:
+        """1物件分のレコードを各列の末尾に追加する"""
+        for col, values in self._floats.items():
+            value = record.get(col)
+            values.append(math.nan if value is None else value)
+        for col, codes in self._codes.items():
+            value = record.get(col) or ""
+            lookup = self._lookup[col]
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(self._categories[col])
+                self._categories[col].append(value)
+            codes.append(code)
+        for col, values in self._strings.items():
+            values.append(record.get(col) or "")
+
+    def to_frame(self):
+        """
+        蓄積したレコードを DataFrame にして返し、バッファを空にする。
+        数値列・コード列は numpy.frombuffer で配列のメモリをそのまま使う。
+        """
+        import numpy as np
+        import pandas as pd
+
+        data = {}
+        for col in LISTING_COLUMNS:
+            if col in self._floats:
+                data[col] = np.frombuffer(self._floats[col], dtype=np.float64)
+            elif col in self._codes:
+                codes = np.frombuffer(self._codes[col], dtype=np.intc)
+                data[col] = pd.Categorical.from_codes(codes, categories=self._categories[col])
+            else:
+                data[col] = self._strings[col]
+        df = pd.DataFrame(data, copy=False)
+        self._reset_columns()
+        return df
+
+
 # ────────────────────────────────────────────────
 # スクレイピング本体
 # ────────────────────────────────────────────────
 
-def parse_properties(soup: BeautifulSoup, city: str, type_name: str) -> list[dict]:
+def parse_properties(
+    soup: BeautifulSoup, city: str, type_name: str, buffer: ListingBuffer
+) -> int:
     """
-    BeautifulSoup から各物件（property_unit）を抽出して辞書のリストで返す。
+    BeautifulSoup から各物件（property_unit）を抽出して buffer に追加し、
+    追加した件数を返す。
 
     SUUMO の HTML 構造（2025年確認）:
       <div class="property_unit ...">
@@ -126,7 +217,7 @@ def parse_properties(soup: BeautifulSoup, city: str, type_name: str) -> list[dic
       </div>
     """
     units = soup.select("div.property_unit")
-    records = []
+    count = 0
 
     for unit in units:
         record: dict = {
@@ -190,14 +281,25 @@ def parse_properties(soup: BeautifulSoup, city: str, type_name: str) -> list[dic
 
         # 価格が取れた物件のみ追加（バナー・広告ブロック除外）
         if record["価格（万円）"] is not None:
-            records.append(record)
+            buffer.append(record)
+            count += 1
 
-    return records
+    return count
 
 
-def scrape_city_type(city: str, city_code: str, type_name: str, bs: str) -> list[dict]:
-    """1市×1種別について全ページを取得してレコードのリストを返す"""
-    all_records: list[dict] = []
+def scrape_city_type(
+    city: str,
+    city_code: str,
+    type_name: str,
+    bs: str,
+    buffer: ListingBuffer,
+    flush: Callable[[], None],
+) -> int:
+    """
+    1市×1種別について全ページを取得して buffer に追加し、取得件数を返す。
+    buffer が FLUSH_ROWS 件に達したら flush() を呼んで書き出す。
+    """
+    total = 0
 
     for page in range(1, MAX_PAGES + 1):
         url = build_url(city_code, bs, page)
@@ -211,80 +313,117 @@ def scrape_city_type(city: str, city_code: str, type_name: str, bs: str) -> list
             break
 
         soup = BeautifulSoup(resp.text, "html.parser")
-        records = parse_properties(soup, city, type_name)
+        count = parse_properties(soup, city, type_name, buffer)
 
-        if not records:
+        if not count:
             if page == 1:
                 print(f"  ⚠ 1件も取得できませんでした（物件なし or HTML構造変更の可能性）")
             else:
                 print(f"  ページ {page}: 件数0のため終了")
             break
 
-        all_records.extend(records)
-        print(f"  → {len(records)} 件取得（累計 {len(all_records)} 件）")
+        total += count
+        print(f"  → {count} 件取得（累計 {total} 件）")
+
+        if len(buffer) >= FLUSH_ROWS:
+            flush()
 
         if not has_next_page(soup):
             break
 
         time.sleep(DELAY_SECONDS)
 
-    return all_records
+    return total
 
 
 # ────────────────────────────────────────────────
 # メイン
 # ────────────────────────────────────────────────
 
+def flush_listings(
+    buffer: ListingBuffer, first: bool, prices: dict[tuple[str, str], array]
+) -> int:
+    """
+    buffer の内容を OUTPUT_FILE に書き出し、書き出した件数を返す。
+    first=True のときはファイルを作り直してヘッダーを書き、以降は追記する。
+    書き出した物件の価格は集計用に prices[(市, 種別)] に追加する。
+    """
+    df = buffer.to_frame()
+
+    # SUUMO はおすすめ広告として他市の物件を混入させることがある。
+    # 「所在地」列が対象市名を含む行のみを残す。
+    before = len(df)
+    mask = [city in address for city, address in zip(df["市"], df["所在地"])]
+    df = df[mask]
+    removed = before - len(df)
+    if removed > 0:
+        print(f"  ※ 所在地フィルター: {removed} 件除外（他市の広告物件）")
+
+    for key, price in zip(zip(df["市"], df["種別"]), df["価格（万円）"]):
+        prices.setdefault(key, array("d")).append(price)
+
+    df.to_csv(
+        OUTPUT_FILE,
+        mode="w" if first else "a",
+        header=first,
+        index=False,
+        encoding="utf-8-sig",
+    )
+    return len(df)
+
+
 def main() -> None:
+    import pandas as pd
+
+    DATA_DIR.mkdir(exist_ok=True)
     print(f"=== SUUMO スクレイピング開始 ({date.today()}) ===")
     print(f"出力先: {OUTPUT_FILE}\n")
 
-    all_records: list[dict] = []
+    buffer = ListingBuffer()
+    # 集計用: (市, 種別) ごとの価格（CSV を読み直さずにサマリーを出すため）
+    prices: dict[tuple[str, str], array] = {}
+    scraped = 0
+    saved = 0
+    flushed = False
+
+    def flush() -> None:
+        nonlocal saved, flushed
+        saved += flush_listings(buffer, first=not flushed, prices=prices)
+        flushed = True
 
     for city, city_code in CITIES.items():
         for type_name, bs in TYPES.items():
             print(f"【{city} / {type_name}】")
-            records = scrape_city_type(city, city_code, type_name, bs)
-            all_records.extend(records)
-            print(f"  小計: {len(records)} 件\n")
+            count = scrape_city_type(city, city_code, type_name, bs, buffer, flush)
+            scraped += count
+            print(f"  小計: {count} 件\n")
             time.sleep(DELAY_SECONDS)
 
-    if not all_records:
+    if not scraped:
         print("⚠ データが1件も取得できませんでした。")
         return
 
-    df = pd.DataFrame(all_records)
-
-    col_order = [
-        "市", "種別", "価格（万円）", "間取り",
-        "専有面積（㎡）", "土地面積（㎡）", "建物面積（㎡）",
-        "築年月", "交通", "所在地", "物件名", "URL",
-    ]
-    for col in col_order:
-        if col not in df.columns:
-            df[col] = None
-    df = df[col_order]
-
-    # SUUMO はおすすめ広告として他市の物件を混入させることがある。
-    # 「所在地」列が対象市名を含む行のみを残す。
-    before = len(df)
-    mask = df.apply(lambda row: str(row["市"]) in str(row["所在地"]), axis=1)
-    df = df[mask].reset_index(drop=True)
-    removed = before - len(df)
-    if removed > 0:
-        print(f"  ※ 所在地フィルター: {removed} 件除外（他市の広告物件）")
-
-    df.to_csv(OUTPUT_FILE, index=False, encoding="utf-8-sig")
+    if len(buffer):
+        flush()
 
     print(f"[OK] 保存完了: {OUTPUT_FILE}")
-    print(f"   総件数: {len(df)} 件\n")
+    print(f"   総件数: {saved} 件\n")
 
-    summary = (
-        df.groupby(["市", "種別"])["価格（万円）"]
-        .agg(件数="count", 中央値="median", 最安値="min", 最高値="max")
-        .round(0)
-        .astype({"件数": int})
-    )
+    if not prices:
+        return
+
+    summary = pd.DataFrame(
+        [
+            {
+                "件数": len(values),
+                "中央値": statistics.median(values),
+                "最安値": min(values),
+                "最高値": max(values),
+            }
+            for values in (prices[key] for key in sorted(prices))
+        ],
+        index=pd.MultiIndex.from_tuples(sorted(prices), names=["市", "種別"]),
+    ).round(0)
     print(summary.to_string())
 
 